@@ -11,7 +11,6 @@ Demonstrates:
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyBboxPatch
-import seaborn as sns
 
 from figcombo import Figure, PlotPanel, register_plot_type
 
@@ -28,7 +27,7 @@ def survival_curve(ax, data, **kwargs):
     ):
         ax.step(time, surv, where='post', label=label, color=color, linewidth=1.2)
         # Add censoring marks
-        censor_idx = np.random.choice(len(time), size=3, replace=False)
+        censor_idx = rng.choice(len(time), size=3, replace=False)
         ax.plot(
             time[censor_idx], surv[censor_idx],
             '|', color=color, markersize=6, markeredgewidth=1.5,
@@ -58,7 +57,7 @@ def violin_comparison(ax, data, **kwargs):
         for pc in parts['bodies']:
             pc.set_alpha(0.7)
         # Overlay individual points with jitter
-        jitter = np.random.normal(0, 0.04, size=len(group_data))
+        jitter = rng.normal(0, 0.04, size=len(group_data))
         ax.scatter(
             np.full_like(group_data, i) + jitter, group_data,
             s=8, alpha=0.4, color='black', zorder=3,
@@ -85,32 +84,42 @@ def violin_comparison(ax, data, **kwargs):
 # Generate synthetic data
 # ============================================================
 
-np.random.seed(2026)
+# Shared generator for all synthetic data and jitter in this example
+rng = np.random.default_rng(2026)
 
 # Panel a: "microscopy" placeholder - colored noise image
+# Pixel row/column indices of the microscopy canvas, shared by every disk.
+# int32 rather than int16: squared distances reach 299**2 and would wrap.
+MICRO_YY, MICRO_XX = np.indices((200, 300), dtype=np.int32)
+
+
+def _disk(cx, cy, r):
+    """Boolean mask of the disk of radius r centred on row cx, column cy."""
+    dy = MICRO_YY - int(cx)
+    dx = MICRO_XX - int(cy)
+    return dx * dx + dy * dy <= int(r) * int(r)
+
+
 def microscopy_placeholder(ax, data, **kwargs):
     """Fake microscopy image as placeholder."""
-    img = np.zeros((200, 300, 3))
-    # Green channel (GFP-like)
+    img = np.zeros((200, 300, 3), dtype=np.float32)
+    # Green channel (GFP-like); overlapping cells keep the brighter one
     for _ in range(15):
-        cx, cy = np.random.randint(20, 180), np.random.randint(20, 280)
-        yy, xx = np.ogrid[-cx:200-cx, -cy:300-cy]
-        r = np.random.randint(8, 25)
-        mask = xx**2 + yy**2 <= r**2
-        intensity = np.random.uniform(0.4, 1.0)
-        img[:, :, 1] = np.clip(img[:, :, 1] + mask * intensity, 0, 1)
+        cx, cy = rng.integers(20, 180), rng.integers(20, 280)
+        r = rng.integers(8, 25)
+        intensity = rng.uniform(0.4, 1.0)
+        np.maximum(img[:, :, 1], _disk(cx, cy, r) * intensity, out=img[:, :, 1])
     # Add some blue (DAPI-like)
     for _ in range(25):
-        cx, cy = np.random.randint(10, 190), np.random.randint(10, 290)
-        yy, xx = np.ogrid[-cx:200-cx, -cy:300-cy]
-        r = np.random.randint(4, 10)
-        mask = xx**2 + yy**2 <= r**2
-        img[:, :, 2] = np.clip(img[:, :, 2] + mask * 0.6, 0, 1)
-    # Background noise
-    img += np.random.normal(0, 0.02, img.shape)
-    img = np.clip(img, 0, 1)
-
-    ax.imshow(img)
+        cx, cy = rng.integers(10, 190), rng.integers(10, 290)
+        r = rng.integers(4, 10)
+        np.maximum(img[:, :, 2], _disk(cx, cy, r) * 0.6, out=img[:, :, 2])
+    # Background noise, added and clipped in place
+    img += rng.normal(0, 0.02, img.shape)
+    np.clip(img, 0, 1, out=img)
+
+    # Hand imshow 8-bit RGB so it skips its own float normalisation pass
+    ax.imshow((img * 255).astype(np.uint8), interpolation='nearest')
     ax.set_axis_off()
     # Scale bar
     bar_y = 185
@@ -121,8 +130,10 @@ def microscopy_placeholder(ax, data, **kwargs):
 
 # Panel b: survival data
 n_time = 50
-time_ctrl = np.sort(np.random.exponential(20, n_time))
-time_treat = np.sort(np.random.exponential(35, n_time))
+time_ctrl = rng.exponential(20, n_time)
+time_ctrl.sort()
+time_treat = rng.exponential(35, n_time)
+time_treat.sort()
 surv_ctrl = np.linspace(1, 0.15, n_time)
 surv_treat = np.linspace(1, 0.45, n_time)
 survival_data = {
@@ -136,9 +147,9 @@ survival_data = {
 violin_data = {
     'labels': ['WT', 'KO', 'KO+Rescue'],
     'groups': [
-        np.random.normal(5, 1.2, 30),
-        np.random.normal(2.5, 1.5, 30),
-        np.random.normal(4.8, 1.0, 30),
+        rng.normal(5, 1.2, 30),
+        rng.normal(2.5, 1.5, 30),
+        rng.normal(4.8, 1.0, 30),
     ],
     'ylabel': 'Expression (AU)',
     'comparisons': [(0, 1, '***'), (1, 2, '**')],
@@ -147,7 +158,7 @@ violin_data = {
 # Panel d: bar chart with individual points
 bar_groups = ['Ctrl', 'Low', 'Med', 'High']
 bar_means = [1.0, 1.8, 2.9, 4.2]
-bar_raw = [np.random.normal(m, 0.5, 8) for m in bar_means]
+bar_raw = [rng.normal(m, 0.5, 8) for m in bar_means]
 
 def dose_response(ax, data, **kwargs):
     """Bar chart with individual data points."""
@@ -159,7 +170,7 @@ def dose_response(ax, data, **kwargs):
         sem = np.std(raw) / np.sqrt(len(raw))
         ax.bar(i, mean, yerr=sem, capsize=3,
                color=color, edgecolor='black', linewidth=0.5, alpha=0.7)
-        jitter = np.random.normal(0, 0.08, size=len(raw))
+        jitter = rng.normal(0, 0.08, size=len(raw))
         ax.scatter(np.full_like(raw, i) + jitter, raw,
                    s=12, color='black', alpha=0.5, zorder=3)
     ax.set_xticks(range(len(data['groups'])))
@@ -173,23 +184,26 @@ dose_data = {'groups': bar_groups, 'raw': bar_raw}
 n_genes, n_samples = 10, 6
 gene_names = [f'Gene{i+1}' for i in range(n_genes)]
 sample_names = ['Ctrl1', 'Ctrl2', 'Ctrl3', 'KO1', 'KO2', 'KO3']
-expr_matrix = np.random.randn(n_genes, n_samples)
+expr_matrix = rng.standard_normal((n_genes, n_samples))
 expr_matrix[:5, 3:] += 2  # upregulated in KO
 expr_matrix[5:, 3:] -= 1.5  # downregulated in KO
 
 def expression_heatmap(ax, data, **kwargs):
     """Gene expression heatmap."""
-    sns.heatmap(
-        data['matrix'], ax=ax,
-        cmap='RdBu_r', center=0,
-        xticklabels=data['samples'],
-        yticklabels=data['genes'],
-        linewidths=0.3,
-        cbar_kws={'shrink': 0.6, 'label': 'Z-score', 'pad': 0.02},
-    )
-    ax.set_xlabel('')
-    ax.set_ylabel('')
-    ax.tick_params(axis='y', rotation=0)
+    mat = data['matrix']
+    n_rows, n_cols = mat.shape
+    vmax = np.abs(mat).max()
+    im = ax.imshow(mat, cmap='RdBu_r', vmin=-vmax, vmax=vmax, aspect='auto')
+    ax.figure.colorbar(im, ax=ax, shrink=0.6, label='Z-score', pad=0.02)
+    ax.set_xticks(range(n_cols), data['samples'], rotation=90)
+    ax.set_yticks(range(n_rows), data['genes'])
+    # White cell borders on the minor grid
+    ax.set_xticks(np.arange(n_cols + 1) - 0.5, minor=True)
+    ax.set_yticks(np.arange(n_rows + 1) - 0.5, minor=True)
+    ax.grid(which='minor', color='white', linewidth=0.3)
+    ax.tick_params(which='minor', length=0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
 
 heatmap_data = {
     'matrix': expr_matrix,
@@ -5,7 +5,6 @@ publication-ready multi-panel figures.
 """
 
 import numpy as np
-import pandas as pd
 import matplotlib.pyplot as plt
 
 from figcombo import Figure, ImagePanel, PlotPanel
@@ -16,19 +15,20 @@ def create_sample_data():
     """Create sample data for demonstration."""
     np.random.seed(42)
 
-    # Bar chart data
-    bar_data = pd.DataFrame({
-        'group': ['Control', 'Treatment A', 'Treatment B', 'Treatment C'],
-        'value': [100, 145, 132, 178],
-        'error': [10, 15, 12, 18]
-    })
+    # Bar chart data (plain NumPy columns; no pandas needed)
+    bar_data = {
+        'group': np.array(['Control', 'Treatment A', 'Treatment B', 'Treatment C']),
+        'value': np.array([100, 145, 132, 178]),
+        'error': np.array([10, 15, 12, 18]),
+    }
 
-    # Scatter plot data
-    scatter_data = pd.DataFrame({
+    # Scatter plot data. Colouring by 'group' (hue) converts the dict to a
+    # pandas DataFrame and draws it with seaborn, so this panel needs pandas.
+    scatter_data = {
         'x': np.random.normal(50, 15, 50),
         'y': np.random.normal(50, 15, 50),
-        'group': np.random.choice(['A', 'B'], 50)
-    })
+        'group': np.random.choice(['A', 'B'], 50),
+    }
 
     return bar_data, scatter_data
 
@@ -1,23 +1,55 @@
-"""Export engine for saving figures in publication-ready formats."""
+"""Export engine for saving figures in publication-ready formats.
+
+Set ``FIGCOMBO_PREWARM=1`` to load the PDF/Agg backends and the font cache
+when this module is imported, instead of on the first save.
+"""
 
 from __future__ import annotations
 
+import os
+import pickle
 import warnings
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import matplotlib as mpl
 from matplotlib.figure import Figure as MplFigure
 
+if os.environ.get('FIGCOMBO_PREWARM', '0') == '1':
+    import matplotlib.backends.backend_agg  # noqa: F401
+    import matplotlib.backends.backend_pdf  # noqa: F401
+    from matplotlib import font_manager
+
+    font_manager.fontManager.findfont(font_manager.FontProperties())
+
 
-# Format-specific defaults
-FORMAT_DEFAULTS: dict[str, dict[str, Any]] = {
-    'pdf': {'dpi': 300, 'transparent': False},
+# Format-specific defaults (read-only, nested dicts included; save_figure
+# copies them into fresh kwargs dicts per format)
+_FORMAT_DEFAULTS: dict[str, dict[str, Any]] = {
+    'pdf': {'dpi': 300, 'transparent': False, 'metadata': {'Creator': 'FigCombo'}},
     'eps': {'dpi': 300, 'transparent': False},
     'png': {'dpi': 300, 'transparent': False},
-    'tiff': {'dpi': 600, 'transparent': False, 'pil_kwargs': {'compression': 'tiff_lzw'}},
-    'tif': {'dpi': 600, 'transparent': False, 'pil_kwargs': {'compression': 'tiff_lzw'}},
+    'tiff': {'dpi': 600, 'transparent': False, 'pil_kwargs': {'compression': 'tiff_adobe_deflate'}},
+    'tif': {'dpi': 600, 'transparent': False, 'pil_kwargs': {'compression': 'tiff_adobe_deflate'}},
     'svg': {'dpi': 300, 'transparent': True},
 }
+FORMAT_DEFAULTS: dict[str, Mapping[str, Any]] = {
+    fmt: MappingProxyType({
+        key: MappingProxyType(value) if isinstance(value, dict) else value
+        for key, value in defaults.items()
+    })
+    for fmt, defaults in _FORMAT_DEFAULTS.items()
+}
+_NO_DEFAULTS: Mapping[str, Any] = MappingProxyType({})
+
+# rcParams that affect how an already-built figure is written out. Worker
+# processes started with spawn/forkserver do not inherit the parent's
+# runtime rcParams (e.g. pdf.fonttype from StyleManager.apply), so
+# save_figure passes these along with the pickled figure.
+_WORKER_RC_PREFIXES = ('pdf.', 'ps.', 'svg.', 'savefig.', 'font.', 'mathtext.', 'text.')
 
 
 def save_figure(
@@ -25,6 +57,8 @@ def save_figure(
     path: str | Path,
     dpi: int | None = None,
     formats: list[str] | None = None,
+    parallel: bool = False,
+    png_compress_level: int | None = None,
     **kwargs: Any,
 ) -> list[Path]:
     """Save a figure to one or more formats.
@@ -41,6 +75,13 @@ def save_figure(
     formats : list of str, optional
         Formats to save in (e.g. ['pdf', 'png']). Only used when
         path has no extension.
+    parallel : bool, optional
+        If True and more than one format is requested, pickle the figure
+        once and write each format in its own worker process, so e.g. the
+        PDF and PNG exports overlap. Default False.
+    png_compress_level : int, optional
+        zlib level (0-9) for PNG output. Lower is faster to write and
+        larger on disk; None keeps Pillow's default of 6.
     **kwargs
         Additional kwargs passed to fig.savefig().
 
@@ -50,7 +91,6 @@ def save_figure(
         Paths to saved files.
     """
     path = Path(path)
-    saved: list[Path] = []
 
     # Determine formats
     if path.suffix:
@@ -59,39 +99,110 @@ def save_figure(
     else:
         if formats is None:
             formats = ['pdf']
-        save_paths = [(path.with_suffix(f'.{fmt}'), fmt) for fmt in formats]
+        parent = path.parent
+        save_paths = [(parent / f'{path.name}.{fmt}', fmt) for fmt in formats]
 
+    # Every format lands in the same directory
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    jobs = []
     for save_path, fmt in save_paths:
-        save_kwargs = FORMAT_DEFAULTS.get(fmt, {}).copy()
+        # Nested defaults (metadata, pil_kwargs) are copied too, so savefig
+        # never receives the shared module-level dicts
+        save_kwargs = {
+            key: dict(value) if isinstance(value, Mapping) else value
+            for key, value in FORMAT_DEFAULTS.get(fmt, _NO_DEFAULTS).items()
+        }
+        save_kwargs.update(kwargs)
+        # Trimming follows savefig.bbox (e.g. 'tight' from the bundled
+        # .mplstyle files) unless the caller passes bbox_inches
+        save_kwargs.setdefault('bbox_inches', mpl.rcParams['savefig.bbox'])
         if dpi is not None:
             save_kwargs['dpi'] = dpi
-        save_kwargs.update(kwargs)
-
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Check if figure uses constrained_layout — if so, disable
-        # before saving to prevent re-computation that can collapse
-        # small axes.
-        uses_cl = getattr(fig, 'get_constrained_layout', lambda: False)()
-        if uses_cl:
-            fig.set_constrained_layout(False)
-
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore', UserWarning)
-            fig.savefig(
-                str(save_path),
-                format=fmt,
-                **save_kwargs,
-            )
-
+        if fmt == 'png' and png_compress_level is not None:
+            save_kwargs['pil_kwargs'] = {
+                **save_kwargs.get('pil_kwargs', {}),
+                'compress_level': png_compress_level,
+            }
+        jobs.append((save_path, fmt, save_kwargs))
+
+    # Check if figure uses constrained_layout — if so, disable
+    # before saving to prevent re-computation that can collapse
+    # small axes.
+    uses_cl = fig.get_constrained_layout()
+    if uses_cl:
+        fig.set_constrained_layout(False)
+
+    try:
+        if parallel and len(jobs) > 1:
+            pickled = pickle.dumps(fig)
+            rc = {
+                key: value
+                for key, value in mpl.rcParams.items()
+                if key.startswith(_WORKER_RC_PREFIXES)
+            }
+            workers = min(len(jobs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _save_worker, pickled, rc, save_path, fmt, save_kwargs
+                    )
+                    for save_path, fmt, save_kwargs in jobs
+                ]
+                saved = [future.result() for future in futures]
+        else:
+            saved = [
+                _savefig(fig, save_path, fmt, save_kwargs)
+                for save_path, fmt, save_kwargs in jobs
+            ]
+    finally:
         if uses_cl:
             fig.set_constrained_layout(True)
 
-        saved.append(save_path)
-
     return saved
 
 
+def _savefig(
+    fig: MplFigure,
+    save_path: Path,
+    fmt: str,
+    save_kwargs: dict[str, Any],
+) -> Path:
+    """Write a single format of the figure to disk.
+
+    PDF streams are written at maximum zlib compression unless
+    pdf.compression has been changed from matplotlib's default.
+    """
+    rc = {}
+    if mpl.rcParams['pdf.compression'] == mpl.rcParamsDefault['pdf.compression']:
+        rc['pdf.compression'] = 9
+    with warnings.catch_warnings(), mpl.rc_context(rc):
+        warnings.simplefilter('ignore', UserWarning)
+        fig.savefig(
+            str(save_path),
+            format=fmt,
+            **save_kwargs,
+        )
+    return save_path
+
+
+def _save_worker(
+    pickled_fig: bytes,
+    rc: dict[str, Any],
+    save_path: Path,
+    fmt: str,
+    save_kwargs: dict[str, Any],
+) -> Path:
+    """Process-pool entry point: unpickle the figure and save one format.
+
+    ``rc`` is the parent's snapshot of the output-related rcParams, applied
+    around the save so the worker writes the same fonts and file settings.
+    """
+    with mpl.rc_context(rc):
+        fig = pickle.loads(pickled_fig)
+        return _savefig(fig, save_path, fmt, save_kwargs)
+
+
 def save_for_journal(
     fig: MplFigure,
     path: str | Path,
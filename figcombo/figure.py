@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 from matplotlib.figure import Figure as MplFigure
@@ -12,14 +14,29 @@ from figcombo.knowledge.layout_templates import get_template
 from figcombo.knowledge.validators import validate_figure
 from figcombo.layout.parser import parse_ascii_layout, layout_from_explicit
 from figcombo.layout.grid import compute_panel_sizes_mm
-from figcombo.layout.types import LayoutGrid
+from figcombo.layout.types import LayoutGrid, PanelPosition
 from figcombo.panels.base import BasePanel
+from figcombo.panels.image_panel import ImagePanel
+from figcombo.preview import show_preview, show_preview_blocking
 from figcombo.renderer import Renderer
 from figcombo.styles.manager import StyleManager
 from figcombo.export import save_figure, save_for_journal
 from figcombo.utils import mm_to_inch, compute_figure_height
 
 
+# Accepted spellings of the column sizes -> journal 'widths' keys
+_SIZE_ALIASES: dict[str, str] = {
+    f'{name}{suffix}': key
+    for key, names in (
+        ('single', ('single',)),
+        ('mid', ('mid', 'middle', '1.5')),
+        ('double', ('double',)),
+    )
+    for name in names
+    for suffix in ('', '_column', '-column')
+}
+
+
 class Figure:
     """Main class for composing multi-panel scientific figures.
 
@@ -59,6 +76,21 @@ class Figure:
     >>> fig.save('Figure1.pdf')
     """
 
+    __slots__ = (
+        '_journal_key',
+        '_journal_spec',
+        '_width_mm',
+        '_height_mm',
+        '_layout',
+        '_style',
+        '_panels',
+        '_spacing_mm',
+        '_auto_label',
+        '_rendered_figure',
+        '_dirty',
+        '_panel_sizes_cache',
+    )
+
     def __init__(
         self,
         journal: str = 'nature',
@@ -82,14 +114,7 @@ class Figure:
             self._width_mm = width_mm
         else:
             widths = self._journal_spec.get('widths', {})
-            # Normalize size name
-            size_key = size.replace('_column', '').replace('-column', '')
-            if size_key == 'double':
-                size_key = 'double'
-            elif size_key == 'single':
-                size_key = 'single'
-            elif size_key in ('1.5', 'mid', 'middle'):
-                size_key = 'mid'
+            size_key = _SIZE_ALIASES.get(size, size)
             self._width_mm = widths.get(size_key, widths.get('double', 183))
 
         # Parse layout
@@ -138,6 +163,12 @@ class Figure:
         self._spacing_mm = spacing_mm
         self._auto_label = auto_label
         self._rendered_figure: MplFigure | None = None
+        # Set whenever layout, panels or labelling change; render() reuses
+        # the cached figure while it is False
+        self._dirty = True
+        # Panel sizes keyed on (width_mm, height_mm, spacing_mm); cleared
+        # whenever the layout changes
+        self._panel_sizes_cache: dict[tuple, dict[str, tuple[float, float]]] = {}
 
     # -- Layout setup --
 
@@ -178,6 +209,8 @@ class Figure:
                 row_ratios=[1.0] * rows,
                 col_ratios=[1.0] * cols,
             )
+        self._panel_sizes_cache.clear()
+        self._dirty = True
         return self
 
     def add_panel(
@@ -207,8 +240,6 @@ class Figure:
         -------
         self
         """
-        from figcombo.layout.types import PanelPosition
-
         if self._layout is None:
             raise RuntimeError("Set layout first with set_layout(rows=, cols=)")
 
@@ -219,6 +250,8 @@ class Figure:
             rowspan=rowspan,
             colspan=colspan,
         )
+        self._panel_sizes_cache.clear()
+        self._dirty = True
         return self
 
     # -- Panel assignment --
@@ -231,6 +264,7 @@ class Figure:
                 f"Use ImagePanel, PlotPanel, or TextPanel."
             )
         self._panels[label] = panel
+        self._dirty = True
 
     def __getitem__(self, label: str) -> BasePanel:
         """Get a panel by label."""
@@ -241,13 +275,25 @@ class Figure:
 
     # -- Rendering --
 
-    def render(self) -> MplFigure:
+    def render(self, force: bool = False) -> MplFigure:
         """Render the composite figure.
 
+        The rendered figure is cached and reused until the layout, panels
+        or labelling change through this Figure.
+
+        Parameters
+        ----------
+        force : bool
+            Re-render even if nothing has changed, e.g. after mutating a
+            panel object in place.
+
         Returns
         -------
         matplotlib.figure.Figure
         """
+        if not (force or self._dirty) and self._rendered_figure is not None:
+            return self._rendered_figure
+
         if self._layout is None:
             raise RuntimeError(
                 "No layout defined. Use layout= in constructor, "
@@ -265,6 +311,7 @@ class Figure:
         )
 
         self._rendered_figure = renderer.render()
+        self._dirty = False
         return self._rendered_figure
 
     # -- Preview --
@@ -284,10 +331,7 @@ class Figure:
         block : bool
             If True (default), block until the preview window is closed.
         """
-        if self._rendered_figure is None:
-            self.render()
-
-        from figcombo.preview import show_preview, show_preview_blocking
+        self.render()
 
         preview_kwargs = dict(
             figure_width_mm=self._width_mm,
@@ -309,6 +353,8 @@ class Figure:
         path: str | Path,
         dpi: int | None = None,
         formats: list[str] | None = None,
+        parallel: bool = False,
+        png_compress_level: int | None = None,
         **kwargs: Any,
     ) -> list[Path]:
         """Save the figure to file(s).
@@ -321,6 +367,10 @@ class Figure:
             Override DPI.
         formats : list of str, optional
             Formats to save (e.g. ['pdf', 'png']).
+        parallel : bool
+            Write multiple formats concurrently in worker processes.
+        png_compress_level : int, optional
+            zlib level (0-9) for PNG output; None keeps Pillow's default.
         **kwargs
             Additional kwargs for savefig.
 
@@ -329,14 +379,15 @@ class Figure:
         list of Path
             Paths to saved files.
         """
-        if self._rendered_figure is None:
-            self.render()
+        self.render()
 
         return save_figure(
             self._rendered_figure,
             path,
             dpi=dpi,
             formats=formats,
+            parallel=parallel,
+            png_compress_level=png_compress_level,
             **kwargs,
         )
 
@@ -354,8 +405,7 @@ class Figure:
         figure_type : str
             'line_art', 'halftone', or 'combination'.
         """
-        if self._rendered_figure is None:
-            self.render()
+        self.render()
 
         return save_for_journal(
             self._rendered_figure,
@@ -375,21 +425,20 @@ class Figure:
         """
         panels_info = None
         if self._layout is not None and self._panels:
-            sizes = compute_panel_sizes_mm(
-                self._layout,
-                self._width_mm,
-                self._height_mm,
-                self._spacing_mm,
-            )
-            panels_info = []
-            for label, (w, h) in sizes.items():
-                ptype = 'image' if hasattr(self._panels.get(label), 'path') else 'plot'
-                panels_info.append({
+            sizes = self._panel_sizes_mm()
+            image_labels = {
+                label for label, panel in self._panels.items()
+                if isinstance(panel, ImagePanel)
+            }
+            panels_info = [
+                {
                     'label': label,
                     'width_mm': w,
                     'height_mm': h,
-                    'type': ptype,
-                })
+                    'type': 'image' if label in image_labels else 'plot',
+                }
+                for label, (w, h) in sizes.items()
+            ]
 
         return validate_figure(
             figure_width_mm=self._width_mm,
@@ -400,11 +449,26 @@ class Figure:
             font_size=self._style.font_size,
         )
 
+    def _panel_sizes_mm(self) -> dict[str, tuple[float, float]]:
+        """Panel sizes in mm for the current layout, cached per geometry."""
+        key = (self._width_mm, self._height_mm, self._spacing_mm)
+        sizes = self._panel_sizes_cache.get(key)
+        if sizes is None:
+            sizes = compute_panel_sizes_mm(
+                self._layout,
+                self._width_mm,
+                self._height_mm,
+                self._spacing_mm,
+            )
+            self._panel_sizes_cache[key] = sizes
+        return sizes
+
     # -- Convenience --
 
     def auto_label(self, enabled: bool = True) -> 'Figure':
         """Enable/disable automatic panel labeling."""
         self._auto_label = enabled
+        self._dirty = True
         return self
 
     @property
@@ -420,8 +484,9 @@ class Figure:
         return self._layout
 
     @property
-    def panels(self) -> dict[str, BasePanel]:
-        return self._panels
+    def panels(self) -> Mapping[str, BasePanel]:
+        """Assigned panels, read-only; assign with ``fig[label] = panel``."""
+        return MappingProxyType(self._panels)
 
     @property
     def style(self) -> StyleManager:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from difflib import get_close_matches
 from typing import Any
 
 JOURNAL_SPECS: dict[str, dict[str, Any]] = {
@@ -850,28 +852,55 @@ JOURNAL_SPECS: dict[str, dict[str, Any]] = {
 }
 
 
+# Nested sections merged key-by-key down the parent chain
+_NESTED_KEYS = frozenset({'widths', 'font', 'dpi', 'recommended_height'})
+
+
 def _resolve_spec(journal_key: str) -> dict[str, Any]:
-    """Resolve a journal spec, merging with parent if applicable."""
-    spec = JOURNAL_SPECS.get(journal_key)
-    if spec is None:
-        raise ValueError(
-            f"Unknown journal '{journal_key}'. "
-            f"Available: {', '.join(sorted(JOURNAL_SPECS.keys()))}"
-        )
-
-    if 'parent' in spec:
-        parent = _resolve_spec(spec['parent'])
-        merged = {**parent, **spec}
-        merged.pop('parent', None)
-        # Deep merge for nested dicts
-        for key in ('widths', 'font', 'dpi', 'recommended_height'):
-            if key in parent and key in spec:
-                merged[key] = {**parent[key], **spec[key]}
-            elif key in parent:
-                merged[key] = parent[key].copy()
-        return merged
-
-    return spec.copy()
+    """Resolve a journal spec, merging with its parent chain if applicable."""
+    # Walk parent links up to the root, then merge root -> child
+    chain = []
+    seen: set[str] = set()
+    key: str | None = journal_key
+    while key is not None:
+        if key in seen:
+            raise ValueError(
+                f"Journal '{journal_key}' has a cyclic parent chain at '{key}'."
+            )
+        seen.add(key)
+        spec = JOURNAL_SPECS.get(key)
+        if spec is None:
+            raise ValueError(
+                f"Unknown journal '{key}'. "
+                f"Available: {', '.join(sorted(JOURNAL_SPECS.keys()))}"
+            )
+        chain.append(spec)
+        key = spec.get('parent')
+
+    merged: dict[str, Any] = {}
+    for spec in reversed(chain):
+        for field, value in spec.items():
+            if field == 'parent':
+                continue
+            if field in _NESTED_KEYS and field in merged:
+                merged[field] = {**merged[field], **value}
+            else:
+                merged[field] = value
+    return merged
+
+
+def _normalize_key(journal: str) -> str:
+    """Lowercase a journal name and map spaces and hyphens to underscores."""
+    return journal.lower().replace(' ', '_').replace('-', '_')
+
+
+# Journal keys in sorted order, for listings and error messages
+_SORTED_KEYS: tuple[str, ...] = tuple(sorted(JOURNAL_SPECS))
+
+# Every journal resolved once at import, so lookups never merge dicts
+_RESOLVED_SPECS: dict[str, dict[str, Any]] = {
+    key: _resolve_spec(key) for key in JOURNAL_SPECS
+}
 
 
 def get_journal_spec(journal: str) -> dict[str, Any]:
@@ -886,15 +915,57 @@ def get_journal_spec(journal: str) -> dict[str, Any]:
     -------
     dict
         Complete specification dictionary with all fields resolved.
+        The dict is cached and shared between callers; treat it as
+        read-only.
 
     Raises
     ------
     ValueError
         If the journal key is not recognized.
     """
-    return _resolve_spec(journal.lower().replace(' ', '_').replace('-', '_'))
+    spec = _RESOLVED_SPECS.get(journal)
+    if spec is not None:
+        return spec
+    key = _normalize_key(journal)
+    try:
+        return _RESOLVED_SPECS[key]
+    except KeyError:
+        suggestions = suggest_journals(key)
+        if suggestions:
+            hint = (
+                f"Did you mean: {', '.join(suggestions)}? "
+                f"See list_journals() for all {len(_SORTED_KEYS)} journals."
+            )
+        else:
+            hint = f"Available: {', '.join(_SORTED_KEYS)}"
+        raise ValueError(f"Unknown journal '{key}'. {hint}") from None
+
+
+def suggest_journals(query: str, n: int = 5) -> list[str]:
+    """Suggest journal keys for a partial or misspelled journal name.
+
+    Parameters
+    ----------
+    query : str
+        Journal name or key prefix, e.g. 'nature rev' or 'sciense'.
+    n : int
+        Maximum number of suggestions.
+
+    Returns
+    -------
+    list of str
+        Keys starting with the normalized query, in sorted order; if
+        there are none, the closest spellings instead.
+    """
+    key = _normalize_key(query)
+    # Keys sharing a prefix are contiguous in the sorted tuple
+    start = bisect_left(_SORTED_KEYS, key)
+    matches = [k for k in _SORTED_KEYS[start:start + n] if k.startswith(key)]
+    if not matches:
+        matches = get_close_matches(key, _SORTED_KEYS, n=n)
+    return matches
 
 
 def list_journals() -> list[str]:
     """Return sorted list of available journal keys."""
-    return sorted(JOURNAL_SPECS.keys())
+    return list(_SORTED_KEYS)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 # Nature journal standard width (mm)
@@ -396,6 +397,21 @@ LAYOUT_TEMPLATES: dict[str, dict[str, Any]] = {
 }
 
 
+def _index_by_category() -> dict[str, tuple[str, ...]]:
+    """Group template keys by category, keeping LAYOUT_TEMPLATES order."""
+    index: dict[str, list[str]] = {}
+    for key, tmpl in LAYOUT_TEMPLATES.items():
+        index.setdefault(tmpl.get('category', 'basic'), []).append(key)
+    return {category: tuple(keys) for category, keys in index.items()}
+
+
+_BY_CATEGORY: dict[str, tuple[str, ...]] = _index_by_category()
+_NATURE_KEYS: tuple[str, ...] = tuple(
+    key for key in LAYOUT_TEMPLATES if key.startswith('nature_')
+)
+
+
+@lru_cache(maxsize=None)
 def list_templates(
     num_panels: int | None = None,
     category: str | None = None,
@@ -421,19 +437,18 @@ def list_templates(
     categories_found = set()
 
     for key, tmpl in sorted(LAYOUT_TEMPLATES.items()):
+        n = tmpl.get('panels', '?')
         # Filter by number of panels
-        if num_panels is not None and tmpl.get('panels', 0) != num_panels:
+        if num_panels is not None and n != num_panels:
             continue
         # Filter by category
-        tmpl_category = tmpl.get('category', 'basic')
-        categories_found.add(tmpl_category)
-        if category is not None and tmpl_category != category:
+        cat = tmpl.get('category', 'basic')
+        categories_found.add(cat)
+        if category is not None and cat != category:
             continue
 
         desc = tmpl.get('description', '')
-        n = tmpl.get('panels', '?')
         size = tmpl.get('recommended_size', '?')
-        cat = tmpl.get('category', 'basic')
 
         lines.append(f"  {key:35s} [{n} panels, {size:7s}, {cat:12s}] {desc}")
 
@@ -442,8 +457,7 @@ def list_templates(
             ascii_art = tmpl.get('ascii', '')
             if ascii_art:
                 lines.append('')
-                for line in ascii_art.strip().split('\n'):
-                    lines.append(f"      {line}")
+                lines.append('      ' + ascii_art.strip().replace('\n', '\n      '))
                 lines.append('')
 
             # Add recommended panels description
@@ -466,7 +480,9 @@ def list_templates(
         lines.append(f"  Categories: {', '.join(sorted(categories_found))}")
         lines.append("  Use category='name' to filter, show_details=True for full info")
 
-    return header + "\n" + "\n".join(lines) if lines else f"No templates found matching criteria."
+    if not lines:
+        return "No templates found matching criteria."
+    return header + "\n" + "\n".join(lines)
 
 
 def get_templates_by_category(category: str) -> dict[str, dict[str, Any]]:
@@ -480,13 +496,10 @@ def get_templates_by_category(category: str) -> dict[str, dict[str, Any]]:
     Returns
     -------
     dict
-        Dictionary of template names to template data.
+        Dictionary of template names to template data. The template
+        dicts are shared with LAYOUT_TEMPLATES; treat them as read-only.
     """
-    return {
-        key: tmpl.copy()
-        for key, tmpl in LAYOUT_TEMPLATES.items()
-        if tmpl.get('category', 'basic') == category
-    }
+    return {key: LAYOUT_TEMPLATES[key] for key in _BY_CATEGORY.get(category, ())}
 
 
 def get_nature_templates() -> dict[str, dict[str, Any]]:
@@ -495,22 +508,21 @@ def get_nature_templates() -> dict[str, dict[str, Any]]:
     Returns
     -------
     dict
-        Dictionary of Nature template names to template data.
+        Dictionary of Nature template names to template data. The
+        template dicts are shared with LAYOUT_TEMPLATES; treat them as
+        read-only.
     """
-    return {
-        key: tmpl.copy()
-        for key, tmpl in LAYOUT_TEMPLATES.items()
-        if key.startswith('nature_')
-    }
+    return {key: LAYOUT_TEMPLATES[key] for key in _NATURE_KEYS}
 
 
 def get_template(name: str) -> dict[str, Any]:
     """Get a layout template by name.
 
-    Raises ValueError if template not found.
+    The returned dict is shared with LAYOUT_TEMPLATES; treat it as
+    read-only. Raises ValueError if template not found.
     """
     if name not in LAYOUT_TEMPLATES:
         raise ValueError(
             f"Unknown template '{name}'. Use list_templates() to see available templates."
         )
-    return LAYOUT_TEMPLATES[name].copy()
+    return LAYOUT_TEMPLATES[name]
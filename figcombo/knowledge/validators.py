@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 import math
 import os
+from collections import Counter
 from dataclasses import dataclass, field, asdict
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -76,7 +78,7 @@ class ValidationReport:
 
     @property
     def is_clean(self) -> bool:
-        return not self.has_failures and not self.has_warnings
+        return all(r.severity == Severity.PASS for r in self.results)
 
     @property
     def pass_count(self) -> int:
@@ -90,28 +92,30 @@ class ValidationReport:
     def fail_count(self) -> int:
         return sum(1 for r in self.results if r.severity == Severity.FAIL)
 
+    def _severity_counts(self) -> tuple[int, int, int]:
+        """Count (pass, warn, fail) results in a single pass."""
+        counts = Counter(r.severity for r in self.results)
+        return counts[Severity.PASS], counts[Severity.WARN], counts[Severity.FAIL]
+
     def __str__(self) -> str:
-        lines = []
-        for r in self.results:
-            lines.append(str(r))
+        lines = [str(r) for r in self.results]
+        pass_count, warn_count, fail_count = self._severity_counts()
         summary_parts = []
-        if self.pass_count:
-            summary_parts.append(f"{self.pass_count} passed")
-        if self.warn_count:
-            summary_parts.append(f"{self.warn_count} warnings")
-        if self.fail_count:
-            summary_parts.append(f"{self.fail_count} failures")
+        if pass_count:
+            summary_parts.append(f"{pass_count} passed")
+        if warn_count:
+            summary_parts.append(f"{warn_count} warnings")
+        if fail_count:
+            summary_parts.append(f"{fail_count} failures")
         lines.append(f"\nSummary: {', '.join(summary_parts)}")
 
         if self.warnings:
             lines.append("\nAdditional Warnings:")
-            for w in self.warnings:
-                lines.append(f"  - {w}")
+            lines.extend(f"  - {w}" for w in self.warnings)
 
         if self.suggestions:
             lines.append("\nSuggestions:")
-            for s in self.suggestions:
-                lines.append(f"  - {s}")
+            lines.extend(f"  - {s}" for s in self.suggestions)
 
         return "\n".join(lines)
 
@@ -137,11 +141,12 @@ class ValidationReport:
                 print(f"{icon} {r.rule}: {r.message}")
 
         # Summary
+        pass_count, warn_count, fail_count = self._severity_counts()
         print("\n[SUMMARY]")
         print("-" * 40)
-        print(f"  Passed:   {self.pass_count}")
-        print(f"  Warnings: {self.warn_count}")
-        print(f"  Failures: {self.fail_count}")
+        print(f"  Passed:   {pass_count}")
+        print(f"  Warnings: {warn_count}")
+        print(f"  Failures: {fail_count}")
 
         if self.warnings:
             print("\n[WARNINGS]")
@@ -157,9 +162,9 @@ class ValidationReport:
 
         # Final status
         print("\n" + "=" * 60)
-        if self.has_failures:
+        if fail_count:
             print("STATUS: FAILED - Please address the errors above")
-        elif self.has_warnings or self.warnings:
+        elif warn_count or self.warnings:
             print("STATUS: PASSED WITH WARNINGS")
         else:
             print("STATUS: PASSED")
@@ -167,16 +172,17 @@ class ValidationReport:
 
     def to_dict(self) -> dict[str, Any]:
         """Export the validation report as a dictionary."""
+        pass_count, warn_count, fail_count = self._severity_counts()
         return {
             "results": [r.to_dict() for r in self.results],
             "warnings": self.warnings,
             "suggestions": self.suggestions,
             "summary": {
-                "passed": self.pass_count,
-                "warnings": self.warn_count,
-                "failures": self.fail_count,
-                "is_clean": self.is_clean,
-                "has_failures": self.has_failures,
+                "passed": pass_count,
+                "warnings": warn_count,
+                "failures": fail_count,
+                "is_clean": not warn_count and not fail_count,
+                "has_failures": bool(fail_count),
             },
         }
 
@@ -263,7 +269,7 @@ def estimate_file_size(
     uncompressed_size = (width_px * height_px * color_depth) / 8
 
     if format in ('TIFF', 'TIF'):
-        # TIFF can be uncompressed or use LZW
+        # TIFF can be uncompressed or use Deflate/LZW
         estimated_size = uncompressed_size * compression_ratio
     elif format == 'PNG':
         # PNG uses lossless compression
@@ -298,6 +304,7 @@ def estimate_file_size(
     }
 
 
+@lru_cache(maxsize=None)
 def get_recommendations(journal_key: str) -> dict[str, Any]:
     """Get recommendations for a specific journal.
 
@@ -309,7 +316,8 @@ def get_recommendations(journal_key: str) -> dict[str, Any]:
     Returns
     -------
     dict
-        Dictionary with recommendations for the journal.
+        Dictionary with recommendations for the journal. The dict is
+        cached and shared between callers; treat it as read-only.
     """
     from figcombo.knowledge.journal_specs import get_journal_spec
 
@@ -662,7 +670,7 @@ def validate_file_size(
                 "file_size_tiff",
                 f"Large TIFF file ({size_mb:.2f} MB) may cause submission issues"
             )
-            report.add_suggestion("Consider using LZW compression for TIFF files")
+            report.add_suggestion("Consider using lossless (Deflate or LZW) compression for TIFF files")
 
     elif width_mm is not None and height_mm is not None and dpi is not None and format is not None:
         # Estimate file size
@@ -49,11 +49,13 @@ def bar_plot(
     ax : matplotlib.axes.Axes
         The axes to draw on.
     data : pandas.DataFrame or dict
-        Input data. If dict, keys are categories and values are heights.
+        Input data. If dict, keys are categories and values are heights,
+        unless x and y name keys of the dict, in which case it is read as
+        a table of equal-length columns (no pandas needed without hue).
     x : str, optional
-        Column name for x-axis categories (for DataFrame input).
+        Column name for x-axis categories (for DataFrame or column input).
     y : str, optional
-        Column name for y-axis values (for DataFrame input).
+        Column name for y-axis values (for DataFrame or column input).
     hue : str, optional
         Column name for grouping/coloring bars.
     error : str or array-like, optional
@@ -77,13 +79,52 @@ def bar_plot(
     >>> # With dict
     >>> bar_plot(ax, {'A': 10, 'B': 15, 'C': 8}, color='#56B4E9')
 
+    >>> # With a dict of NumPy columns
+    >>> bar_plot(ax, {'group': groups, 'value': values}, x='group', y='value')
+
     >>> # Grouped bars
     >>> bar_plot(ax, df, x='treatment', y='response', hue='timepoint')
     """
+    # Determine colors
+    if color is None:
+        colors = OKABE_ITO
+    elif isinstance(color, str):
+        colors = [color]
+    else:
+        colors = list(color)
+
+    # Handle dict-of-columns input with plain NumPy group statistics
+    if isinstance(data, dict) and x in data and y in data and hue is None:
+        categories, codes = np.unique(np.asarray(data[x]), return_inverse=True)
+        values = np.asarray(data[y], dtype=float)
+        count = np.bincount(codes)
+        mean = np.bincount(codes, weights=values) / count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sq_dev = np.bincount(codes, weights=(values - mean[codes]) ** 2)
+            std = np.sqrt(sq_dev / (count - 1))
+        x_pos = np.arange(len(categories))
+
+        if error is None:
+            yerr = None
+        elif error == 'sem':
+            yerr = std / np.sqrt(count)
+        elif error == 'std':
+            yerr = std
+        elif error in data:
+            errors = np.asarray(data[error], dtype=float)
+            yerr = np.bincount(codes, weights=errors) / count
+        else:
+            yerr = None
+
+        ax.bar(x_pos, mean, yerr=yerr, capsize=capsize, color=colors[0], **kwargs)
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(categories)
+        return
+
     import pandas as pd
 
     # Handle dict input
-    if isinstance(data, dict):
+    if isinstance(data, dict) and not (x in data and y in data):
         categories = list(data.keys())
         values = list(data.values())
         x_pos = np.arange(len(categories))
@@ -94,21 +135,15 @@ def bar_plot(
         ax.set_xticklabels(categories)
         return
 
-    # Handle DataFrame input
+    # Handle DataFrame input (dict-of-columns with hue goes through pandas)
+    if isinstance(data, dict):
+        data = pd.DataFrame(data)
     if not isinstance(data, pd.DataFrame):
         raise TypeError("data must be a DataFrame or dict")
 
     if x is None or y is None:
         raise ValueError("x and y must be specified for DataFrame input")
 
-    # Determine colors
-    if color is None:
-        colors = OKABE_ITO
-    elif isinstance(color, str):
-        colors = [color]
-    else:
-        colors = list(color)
-
     if hue is None:
         # Simple bar plot
         grouped = data.groupby(x)[y].agg(['mean', 'std', 'count']).reset_index()
@@ -122,7 +157,7 @@ def bar_plot(
         elif error == 'std':
             yerr = grouped['std']
         elif error in data.columns:
-            yerr = grouped[error] if error in grouped.columns else None
+            yerr = data.groupby(x)[error].mean().to_numpy()
         else:
             yerr = None
 
@@ -379,12 +414,13 @@ def scatter_plot(
     ----------
     ax : matplotlib.axes.Axes
         The axes to draw on.
-    data : pandas.DataFrame or array-like
-        Input data. If array-like, provide x and y as column indices.
+    data : pandas.DataFrame, dict or array-like
+        Input data. A dict is read as a table of equal-length columns.
+        If array-like, provide x and y as column indices.
     x : str or int
-        Column name (DataFrame) or index (array) for x values.
+        Column name (DataFrame or dict) or index (array) for x values.
     y : str or int
-        Column name (DataFrame) or index (array) for y values.
+        Column name (DataFrame or dict) or index (array) for y values.
     hue : str, optional
         Column name for color grouping.
     size : str, optional
@@ -408,12 +444,31 @@ def scatter_plot(
 
     >>> scatter_plot(ax, df, x='x', y='y', hue='condition', add_regression=True)
     """
-    import pandas as pd
-
     # Determine default color
     if color is None:
         color = OKABE_ITO[0]
 
+    # A dict of columns without grouping stays on plain NumPy arrays;
+    # hue/size/style go through a DataFrame and seaborn like other input
+    if (
+        isinstance(data, dict)
+        and x in data
+        and y in data
+        and hue is None
+        and size is None
+        and style is None
+    ):
+        _scatter_arrays(
+            ax, np.asarray(data[x]), np.asarray(data[y]),
+            color, alpha, add_regression, ci, **kwargs
+        )
+        return
+
+    import pandas as pd
+
+    if isinstance(data, dict):
+        data = pd.DataFrame(data)
+
     # Handle simple array input
     if not isinstance(data, pd.DataFrame):
         if x is not None and y is not None:
@@ -422,20 +477,7 @@ def scatter_plot(
         else:
             x_vals = data[:, 0] if hasattr(data, 'shape') and len(data.shape) > 1 else data[0]
             y_vals = data[:, 1] if hasattr(data, 'shape') and len(data.shape) > 1 else data[1]
-
-        if add_regression:
-            try:
-                import seaborn as sns
-                sns.regplot(x=x_vals, y=y_vals, ax=ax, color=color, ci=ci, **kwargs)
-            except ImportError:
-                ax.scatter(x_vals, y_vals, c=color, alpha=alpha, **kwargs)
-                # Add simple regression line
-                z = np.polyfit(x_vals, y_vals, 1)
-                p = np.poly1d(z)
-                x_line = np.linspace(min(x_vals), max(x_vals), 100)
-                ax.plot(x_line, p(x_line), '--', color=color, linewidth=1)
-        else:
-            ax.scatter(x_vals, y_vals, c=color, alpha=alpha, **kwargs)
+        _scatter_arrays(ax, x_vals, y_vals, color, alpha, add_regression, ci, **kwargs)
         return
 
     # DataFrame input
@@ -683,3 +725,29 @@ def cdf_plot(
 
     ax.set_ylabel('Cumulative Probability')
     ax.set_ylim(0, 1.05)
+
+
+def _scatter_arrays(
+    ax: 'Axes',
+    x_vals: Any,
+    y_vals: Any,
+    color: str,
+    alpha: float,
+    add_regression: bool,
+    ci: int,
+    **kwargs: Any,
+) -> None:
+    """Single-colour scatter of x/y arrays, with optional regression line."""
+    if add_regression:
+        try:
+            import seaborn as sns
+            sns.regplot(x=x_vals, y=y_vals, ax=ax, color=color, ci=ci, **kwargs)
+        except ImportError:
+            ax.scatter(x_vals, y_vals, c=color, alpha=alpha, **kwargs)
+            # Add simple regression line
+            z = np.polyfit(x_vals, y_vals, 1)
+            p = np.poly1d(z)
+            x_line = np.linspace(min(x_vals), max(x_vals), 100)
+            ax.plot(x_line, p(x_line), '--', color=color, linewidth=1)
+    else:
+        ax.scatter(x_vals, y_vals, c=color, alpha=alpha, **kwargs)
@@ -14,7 +14,7 @@ from figcombo.layout.types import LayoutGrid
 from figcombo.layout.grid import SubplotSpec
 from figcombo.panels.base import BasePanel
 from figcombo.styles.manager import StyleManager
-from figcombo.utils import mm_to_inch
+from figcombo.utils import MM_PER_INCH, mm_to_inch
 
 
 class Renderer:
@@ -150,9 +150,9 @@ class Renderer:
             return
 
         fig_w_inch = self._mpl_figure.get_figwidth()
-        fig_w_mm = fig_w_inch * 25.4
+        fig_w_mm = fig_w_inch * MM_PER_INCH
         fig_h_inch = self._mpl_figure.get_figheight()
-        fig_h_mm = fig_h_inch * 25.4
+        fig_h_mm = fig_h_inch * MM_PER_INCH
         tick_size_small = max(4, self.style.tick_size - 1)
 
         for label, ax_or_dict in self._axes.items():
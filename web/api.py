@@ -1328,7 +1328,7 @@ def export_figure():
 
         save_kwargs = {'dpi': dpi, 'facecolor': 'white', 'edgecolor': 'none'}
         if format in ('tiff', 'tif'):
-            save_kwargs['pil_kwargs'] = {'compression': 'tiff_lzw'}
+            save_kwargs['pil_kwargs'] = {'compression': 'tiff_adobe_deflate'}
 
         fig.savefig(output_path, format=format, **save_kwargs)
         plt.close(fig)